@@ -126,6 +126,16 @@ document.body.innerHTML = `
     .msg-bubble em {
       font-style: italic;
     }
+    .msg-bubble canvas {
+      display: block;
+      width: 100%;
+      height: 260px;
+      margin: 8px 0;
+    }
+    .chart-caption {
+      font-size: 0.8em;
+      color: #9ca3af;
+    }
     .msg.user .msg-bubble {
       background: linear-gradient(90deg, #3a8bfd 0%, #6a82fb 100%);
       color: #fff;
@@ -386,7 +396,121 @@ function parseBotMessage(text) {
   return text;
 }
 
-function addMessage(text, sender) {
+const CHART_COLORS = ["#3a8bfd", "#6a82fb", "#f59e0b", "#10b981", "#ef4444"];
+
+function formatChartValue(value, xType) {
+  if (xType === "time") {
+    return new Date(value).toISOString().slice(0, 10);
+  }
+  if (typeof value === "number") {
+    return Math.abs(value) >= 1000 ? value.toExponential(2) : +value.toFixed(2) + "";
+  }
+  return String(value);
+}
+
+function renderChart(chart, container) {
+  // Chart payloads are already downsampled server-side, so drawing every point is cheap
+  const canvas = document.createElement("canvas");
+  container.appendChild(canvas);
+  const width = canvas.clientWidth || 500;
+  const height = canvas.clientHeight || 260;
+  const scale = window.devicePixelRatio || 1;
+  canvas.width = width * scale;
+  canvas.height = height * scale;
+  const ctx = canvas.getContext("2d");
+  ctx.scale(scale, scale);
+
+  const pad = { left: 56, right: 12, top: 12, bottom: 36 };
+  const plotWidth = width - pad.left - pad.right;
+  const plotHeight = height - pad.top - pad.bottom;
+
+  let ys = [];
+  chart.series.forEach((s) => {
+    (s.points || []).forEach((p) => ys.push(p[1]));
+    (s.values || []).forEach((v) => v !== null && ys.push(v));
+  });
+  if (ys.length === 0) return;
+  let yMin = Math.min(0, ...ys);
+  let yMax = Math.max(...ys);
+  if (yMax === yMin) yMax = yMin + 1;
+  const yPos = (y) => pad.top + plotHeight - ((y - yMin) / (yMax - yMin)) * plotHeight;
+
+  // Axes and y labels
+  ctx.strokeStyle = "rgba(255,255,255,0.15)";
+  ctx.fillStyle = "#9ca3af";
+  ctx.font = "11px 'Trebuchet MS'";
+  ctx.textAlign = "right";
+  for (let i = 0; i <= 4; i++) {
+    const y = yMin + ((yMax - yMin) * i) / 4;
+    ctx.beginPath();
+    ctx.moveTo(pad.left, yPos(y));
+    ctx.lineTo(pad.left + plotWidth, yPos(y));
+    ctx.stroke();
+    ctx.fillText(formatChartValue(y), pad.left - 6, yPos(y) + 4);
+  }
+
+  ctx.textAlign = "center";
+  if (chart.type === "line") {
+    const xs = [];
+    chart.series.forEach((s) => s.points.forEach((p) => xs.push(p[0])));
+    const xMin = Math.min(...xs);
+    const xMax = Math.max(...xs) === xMin ? xMin + 1 : Math.max(...xs);
+    const xPos = (x) => pad.left + ((x - xMin) / (xMax - xMin)) * plotWidth;
+
+    for (let i = 0; i <= 3; i++) {
+      const x = xMin + ((xMax - xMin) * i) / 3;
+      ctx.fillText(formatChartValue(x, chart.x_type), xPos(x), height - pad.bottom + 16);
+    }
+
+    chart.series.forEach((s, i) => {
+      ctx.strokeStyle = CHART_COLORS[i % CHART_COLORS.length];
+      ctx.lineWidth = 1.5;
+      ctx.beginPath();
+      s.points.forEach((p, j) => {
+        if (j === 0) ctx.moveTo(xPos(p[0]), yPos(p[1]));
+        else ctx.lineTo(xPos(p[0]), yPos(p[1]));
+      });
+      ctx.stroke();
+    });
+  } else if (chart.type === "bar") {
+    const groupWidth = plotWidth / chart.categories.length;
+    const barWidth = (groupWidth * 0.8) / chart.series.length;
+    chart.categories.forEach((category, c) => {
+      const groupX = pad.left + c * groupWidth + groupWidth * 0.1;
+      chart.series.forEach((s, i) => {
+        const value = s.values[c];
+        if (value === null) return;
+        ctx.fillStyle = CHART_COLORS[i % CHART_COLORS.length];
+        const top = yPos(Math.max(value, 0));
+        ctx.fillRect(groupX + i * barWidth, top, barWidth, Math.abs(yPos(value) - yPos(0)));
+      });
+      if (chart.categories.length <= 12) {
+        ctx.fillStyle = "#9ca3af";
+        ctx.fillText(category.slice(0, 10), groupX + groupWidth * 0.4, height - pad.bottom + 16);
+      }
+    });
+  }
+
+  const caption = document.createElement("div");
+  caption.className = "chart-caption";
+  chart.series.forEach((s, i) => {
+    const swatch = document.createElement("span");
+    swatch.style.color = CHART_COLORS[i % CHART_COLORS.length];
+    swatch.textContent = "■ ";
+    caption.appendChild(swatch);
+    caption.appendChild(document.createTextNode(s.name + "  "));
+  });
+  let text = chart.series_by
+    ? `${chart.value} by ${chart.x} per ${chart.series_by}`
+    : "by " + chart.x;
+  if (chart.omitted_series) text += ` (top ${chart.series.length} of ${chart.series.length + chart.omitted_series} series)`;
+  if (chart.downsampled) text += ` (downsampled from ${chart.total_rows} rows)`;
+  if (chart.omitted_categories) text += ` (top ${chart.categories.length} of ${chart.total_rows})`;
+  caption.appendChild(document.createTextNode(text));
+  container.appendChild(caption);
+}
+
+function addMessage(text, sender, chart = null) {
   const row = document.createElement("div");
   row.className = `msg-row msg ${sender}`;
   const bubble = document.createElement("div");
@@ -398,6 +522,9 @@ function addMessage(text, sender) {
   }
   row.appendChild(bubble);
   chatHistory.appendChild(row);
+  if (chart) {
+    renderChart(chart, bubble);
+  }
   chatHistory.scrollTop = chatHistory.scrollHeight;
 }
 
@@ -523,7 +650,17 @@ ws.onopen = () => {
 
 ws.onmessage = (event) => {
   removeTypingIndicator();
-  addMessage(event.data, "bot");
+  // Replies are JSON with optional chart payload; errors arrive as plain text
+  let reply;
+  try {
+    reply = JSON.parse(event.data);
+  } catch (e) {
+    reply = null;
+  }
+  if (!reply || typeof reply.text !== "string") {
+    reply = { text: event.data, chart: null };
+  }
+  addMessage(reply.text, "bot", reply.chart);
   sendBtn.disabled = false;
 };
 
@@ -0,0 +1,234 @@
+"""
+Chart payloads for query results.
+
+Turns the rows returned by the MCP query tools into a compact, chart-ready
+payload for the web UI, so the browser never receives more than a bounded
+number of points regardless of how many rows the query returned.
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+MAX_POINTS = 500
+MAX_BARS = 30
+MAX_SERIES = 5
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """Return value as a float, or None if it is not numeric."""
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        number = float(value) if isinstance(value, (int, float)) else float(str(value))
+    except ValueError:
+        return None
+    # NaN and infinities are not valid JSON for the browser
+    return number if math.isfinite(number) else None
+
+
+def _to_timestamp(value: Any) -> Optional[float]:
+    """Return an ISO date/time value as epoch milliseconds, or None."""
+    if not isinstance(value, str) or len(value) < 8:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp() * 1000
+
+
+def _convert_column(rows: List[dict], column: str, convert) -> Optional[list]:
+    """Convert every non-null value of a column, or return None if any fails."""
+    converted = []
+    seen = False
+    for row in rows:
+        value = row.get(column)
+        if value is None:
+            converted.append(None)
+            continue
+        result = convert(value)
+        if result is None:
+            return None
+        converted.append(result)
+        seen = True
+    return converted if seen else None
+
+
+def lttb(points: List[List[float]], threshold: int) -> List[List[float]]:
+    """Downsample x-sorted points with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last point and, from each bucket in between, the
+    point forming the largest triangle with its neighbours, which preserves
+    peaks and troughs far better than naive striding.
+    """
+    if threshold >= len(points) or threshold < 3:
+        return points
+
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, len(points))
+        next_bucket = points[next_start:next_end] or [points[-1]]
+        avg_x = sum(p[0] for p in next_bucket) / len(next_bucket)
+        avg_y = sum(p[1] for p in next_bucket) / len(next_bucket)
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = points[a]
+        best_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs(
+                (ax - avg_x) * (points[j][1] - ay) - (ax - points[j][0]) * (avg_y - ay)
+            )
+            if area > best_area:
+                best_area = area
+                best = j
+
+        sampled.append(points[best])
+        a = best
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def _line_chart(
+    rows: List[dict], x_column: str, x_values: list, x_type: str, numeric: dict
+) -> Dict[str, Any]:
+    series = []
+    downsampled = False
+    for name, y_values in numeric.items():
+        points = sorted(
+            [x, y]
+            for x, y in zip(x_values, y_values)
+            if x is not None and y is not None
+        )
+        if len(points) > MAX_POINTS:
+            points = lttb(points, MAX_POINTS)
+            downsampled = True
+        series.append({"name": name, "points": points})
+
+    return {
+        "type": "line",
+        "x": x_column,
+        "x_type": x_type,
+        "series": series,
+        "total_rows": len(rows),
+        "downsampled": downsampled,
+    }
+
+
+def _pivot_line_chart(
+    rows: List[dict],
+    x_column: str,
+    x_values: list,
+    category: str,
+    value: str,
+    y_values: list,
+) -> Dict[str, Any]:
+    """Line chart with one series per category, e.g. month x state x count."""
+    totals: Dict[str, float] = {}
+    for row, y in zip(rows, y_values):
+        name = str(row.get(category))
+        totals[name] = totals.get(name, 0.0) + (y or 0.0)
+    kept = sorted(totals, key=lambda name: abs(totals[name]), reverse=True)
+    kept = kept[:MAX_SERIES]
+
+    numeric = {
+        name: [
+            y if str(row.get(category)) == name else None
+            for row, y in zip(rows, y_values)
+        ]
+        for name in kept
+    }
+    chart = _line_chart(rows, x_column, x_values, "time", numeric)
+    chart["series_by"] = category
+    chart["value"] = value
+    chart["omitted_series"] = len(totals) - len(kept)
+    return chart
+
+
+def _bar_chart(rows: List[dict], category: str, numeric: dict) -> Dict[str, Any]:
+    # Keep the query's own ordering unless there are too many categories
+    kept = list(range(len(rows)))
+    if len(kept) > MAX_BARS:
+        first = next(iter(numeric.values()))
+        kept = sorted(
+            kept,
+            key=lambda i: first[i] if first[i] is not None else float("-inf"),
+            reverse=True,
+        )[:MAX_BARS]
+
+    return {
+        "type": "bar",
+        "x": category,
+        "categories": [str(rows[i].get(category)) for i in kept],
+        "series": [
+            {"name": name, "values": [values[i] for i in kept]}
+            for name, values in numeric.items()
+        ],
+        "total_rows": len(rows),
+        "omitted_categories": len(rows) - len(kept),
+    }
+
+
+def build_chart(rows: Any) -> Optional[Dict[str, Any]]:
+    """Build a chart payload for query result rows, or None if not chartable.
+
+    Rows with a date/time column and numeric columns become a line chart,
+    downsampled with LTTB beyond MAX_POINTS; a single text column alongside
+    them splits the first numeric column into one series per category. Rows
+    with a text column and numeric columns become a bar chart of the top
+    MAX_BARS categories.
+    """
+    if not isinstance(rows, list) or len(rows) < 2:
+        return None
+    if not all(isinstance(row, dict) for row in rows):
+        return None
+
+    columns = list(rows[0].keys())
+    time_columns = {}
+    numeric = {}
+    text_columns = []
+    for column in columns:
+        timestamps = _convert_column(rows, column, _to_timestamp)
+        if timestamps is not None:
+            time_columns[column] = timestamps
+            continue
+        numbers = _convert_column(rows, column, _to_number)
+        if numbers is not None:
+            numeric[column] = numbers
+        else:
+            text_columns.append(column)
+
+    if time_columns and numeric:
+        x_column, x_values = next(iter(time_columns.items()))
+        if len(text_columns) == 1:
+            value, y_values = next(iter(numeric.items()))
+            return _pivot_line_chart(
+                rows, x_column, x_values, text_columns[0], value, y_values
+            )
+        if text_columns:
+            # Several grouping columns would interleave into one zigzag line
+            return None
+        numeric = dict(list(numeric.items())[:MAX_SERIES])
+        return _line_chart(rows, x_column, x_values, "time", numeric)
+
+    if text_columns and numeric:
+        numeric = dict(list(numeric.items())[:MAX_SERIES])
+        return _bar_chart(rows, text_columns[0], numeric)
+
+    if len(numeric) >= 2 and columns[0] in numeric:
+        x_values = numeric.pop(columns[0])
+        numeric = dict(list(numeric.items())[:MAX_SERIES])
+        return _line_chart(rows, columns[0], x_values, "number", numeric)
+
+    return None
@@ -1,6 +1,8 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from databot import DataBot
+from charts import build_chart
 from contextlib import asynccontextmanager
+import json
 import logging
 
 
@@ -21,9 +23,14 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             data = await websocket.receive_text()
-            response = await chatbot.process_query(data)
+            results = []
+            response = await chatbot.process_query(data, results)
             logging.info(response)
-            await websocket.send_text(response or "")
+            # Chart the last query result, downsampled server-side
+            chart = build_chart(results[-1]) if results else None
+            await websocket.send_text(
+                json.dumps({"text": response or "", "chart": chart})
+            )
     except WebSocketDisconnect:
         logging.info("Client disconnected")
     except Exception as e:
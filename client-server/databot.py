@@ -22,6 +22,8 @@ tracer = tracer_provider.get_tracer(__name__)
 
 MODEL = "claude-3-7-sonnet-20250219"
 MAX_TOKENS = 2024
+# Tools whose rows are raw query results that can be charted as-is
+CHART_TOOLS = ("execute_query",)
 
 
 load_dotenv()
@@ -126,8 +128,22 @@ class DataBot:
             logging.error(f"Tool call failed for {tool_name}: {e}")
             return {"error": f"Tool call failed: {str(e)}"}
 
+    def _extract_rows(self, result):
+        """Return the data rows of a query tool result, if it has any."""
+        for item in getattr(result, "content", None) or []:
+            if getattr(item, "type", None) != "text":
+                continue
+            try:
+                payload = json.loads(item.text)
+            except ValueError:
+                continue
+            if isinstance(payload, dict) and isinstance(payload.get("data"), list):
+                return payload["data"]
+        return None
+
     @tracer.chain(name="process_query")
-    async def process_query(self, query):
+    async def process_query(self, query, results=None):
+        """Answer a query, appending execute_query data rows to results."""
         messages = [{"role": "user", "content": query}]
         response = self._create_anthropic_response(messages)
         process_query = True
@@ -151,6 +167,11 @@ class DataBot:
                     session = self.tool_to_session[tool_name]
                     result = await self._call_tool(session, tool_name, tool_args)
 
+                    if results is not None and tool_name in CHART_TOOLS:
+                        rows = self._extract_rows(result)
+                        if rows:
+                            results.append(rows)
+
                     # Handle both successful results and errors
                     if isinstance(result, dict) and "error" in result:
                         content = result["error"]
@@ -5,6 +5,7 @@ Loads all CSV files from a folder into PostgreSQL database with automatic table
 """
 
 import os
+import hashlib
 import pandas as pd
 import psycopg2
 from psycopg2.extras import execute_values
@@ -12,7 +13,7 @@ import argparse
 import sys
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 import time
 from datetime import datetime
 
@@ -24,6 +25,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Recognised input file suffixes, longest first so "orders.csv.gz" -> "orders"
+CSV_COMPRESSION = {
+    ".csv.gz": "gzip",
+    ".csv.zst": "zstd",
+    ".csv.zstd": "zstd",
+    ".csv": None,
+}
+CSV_SUFFIXES = tuple(CSV_COMPRESSION)
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+# Bytes of CSV text parsed per block when staging into the Parquet cache
+STAGING_BLOCK_SIZE = 16 << 20
+# Date/time formats recognised while staging, besides ISO 8601
+STAGING_TIMESTAMP_FORMATS = ("%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M", "%m/%d/%Y")
+# Bumped whenever staged Parquet files would be typed differently
+STAGING_CACHE_VERSION = 2
+
+# pandas dtypes used to read CSV columns of each inferred kind
+CSV_KIND_DTYPES = {
+    "int": "Int64",
+    "float": "float64",
+    "bool": "boolean",
+    "datetime": "object",
+    "text": "object",
+}
+
 
 class BulkCSVLoader:
     def __init__(
@@ -34,8 +62,21 @@ class BulkCSVLoader:
         user: str,
         password: str,
         schema: str = "public",
+        partition: bool = False,
+        partition_column: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        batch_rows: int = 100000,
     ):
-        """Initialize database connection parameters."""
+        """Initialize database connection parameters.
+
+        When ``partition`` is set, tables are created as declaratively
+        partitioned tables, ranged by month on ``partition_column`` (or on the
+        first detected timestamp column when no column is configured).
+
+        When ``cache_dir`` is set, each CSV input is converted once into a
+        typed Parquet file keyed by its content hash, and later loads read the
+        Parquet copy in batches of ``batch_rows`` instead of re-parsing text.
+        """
         self.connection_params = {
             "host": host,
             "port": port,
@@ -44,8 +85,19 @@ class BulkCSVLoader:
             "password": password,
         }
         self.schema = schema
+        self.partition = partition
+        self.partition_column = partition_column
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.batch_rows = batch_rows
         self.conn = None
         self.cursor = None
+        # Monthly partitions already known to exist, keyed by table name
+        self._known_partitions: Dict[str, set] = {}
+        # Resolved partition key (None for flat tables), keyed by table name
+        self._partition_keys: Dict[str, Optional[str]] = {}
+        # Set while a whole file is loaded in one transaction
+        self._file_transaction = False
+        self.last_error: Optional[str] = None
 
     def connect(self):
         """Establish database connection."""
@@ -65,6 +117,11 @@ class BulkCSVLoader:
             self.conn.close()
         logger.info("Database connection closed")
 
+    def _commit(self):
+        """Commit, unless a whole-file transaction is in progress."""
+        if not self._file_transaction:
+            self.conn.commit()
+
     def get_postgres_type(self, pandas_dtype: str, sample_data: Any = None) -> str:
         """Map pandas data types to PostgreSQL data types with smart detection."""
         type_mapping = {
@@ -72,14 +129,23 @@ class BulkCSVLoader:
             "string": "TEXT",
             "int64": "BIGINT",
             "int32": "INTEGER",
+            "int16": "SMALLINT",
+            "int8": "SMALLINT",
             "float64": "DOUBLE PRECISION",
             "float32": "REAL",
             "bool": "BOOLEAN",
-            "datetime64[ns]": "TIMESTAMP",
+            "boolean": "BOOLEAN",
             "category": "TEXT",
         }
 
-        pg_type = type_mapping.get(str(pandas_dtype), "TEXT")
+        # Arrow-backed reads keep their source time unit and time zone
+        if pd.api.types.is_datetime64_any_dtype(pandas_dtype):
+            if isinstance(pandas_dtype, pd.DatetimeTZDtype):
+                return "TIMESTAMPTZ"
+            return "TIMESTAMP"
+
+        # Nullable extension dtypes (Int64, Float64, boolean) map like numpy ones
+        pg_type = type_mapping.get(str(pandas_dtype).lower(), "TEXT")
 
         # Smart type detection for object columns
         if pandas_dtype == "object" and sample_data is not None:
@@ -115,7 +181,37 @@ class BulkCSVLoader:
             cleaned = "unnamed_column"
         return cleaned.lower()
 
-    def create_table(self, table_name: str, df: pd.DataFrame) -> bool:
+    def get_partition_column(self, df: pd.DataFrame) -> Optional[str]:
+        """Return the column to range-partition on, or None for a flat table."""
+        if not self.partition:
+            return None
+
+        if self.partition_column:
+            column = self.clean_column_name(self.partition_column)
+            if column in df.columns:
+                return column
+            logger.warning(
+                f"Partition column {column} not found, creating a flat table"
+            )
+            return None
+
+        # Detect the first timestamp column
+        for col, dtype in df.dtypes.items():
+            sample_data = (
+                df[col].dropna().iloc[0] if not df[col].dropna().empty else None
+            )
+            if self.get_postgres_type(dtype, sample_data) in (
+                "TIMESTAMP",
+                "TIMESTAMPTZ",
+            ):
+                return col
+
+        logger.warning("No timestamp column detected, creating a flat table")
+        return None
+
+    def create_table(
+        self, table_name: str, df: pd.DataFrame, partition_column: str = None
+    ) -> bool:
         """Create table based on DataFrame structure."""
         try:
             # Clean table name
@@ -130,25 +226,216 @@ class BulkCSVLoader:
                     df[col].dropna().iloc[0] if not df[col].dropna().empty else None
                 )
                 pg_type = self.get_postgres_type(dtype, sample_data)
+                if clean_col == partition_column and pg_type != "TIMESTAMPTZ":
+                    pg_type = "TIMESTAMP"
                 columns.append(f'"{clean_col}" {pg_type}')
 
+            partition_clause = (
+                f' PARTITION BY RANGE ("{partition_column}")'
+                if partition_column
+                else ""
+            )
+
             # Create table SQL
             create_sql = f"""
             CREATE TABLE IF NOT EXISTS {self.schema}.{table_name} (
                 {', '.join(columns)}
-            );
+            ){partition_clause};
             """
 
             self.cursor.execute(create_sql)
-            self.conn.commit()
+
+            if partition_column:
+                # Rows with a NULL partition key can only go to a default partition
+                self.cursor.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {self.schema}.{table_name}_default
+                    PARTITION OF {self.schema}.{table_name} DEFAULT;
+                    """
+                )
+
+            self._commit()
             logger.info(f"Table {self.schema}.{table_name} created successfully")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to create table {table_name}: {e}")
+            self.last_error = f"Failed to create table {table_name}: {e}"
+            logger.error(self.last_error)
             self.conn.rollback()
+            self._partition_keys.pop(table_name, None)
             return False
 
+    def table_exists(self, table_name: str) -> bool:
+        """Check whether a table (or detached partition) exists in the schema."""
+        table_name = self.clean_column_name(table_name)
+        self.cursor.execute(
+            "SELECT to_regclass(%s) IS NOT NULL", (f"{self.schema}.{table_name}",)
+        )
+        return self.cursor.fetchone()[0]
+
+    def is_partitioned(self, table_name: str) -> bool:
+        """Check whether a table is a declaratively partitioned table."""
+        table_name = self.clean_column_name(table_name)
+        self.cursor.execute(
+            """
+            SELECT 1
+            FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relname = %s
+            """,
+            (self.schema, table_name),
+        )
+        return self.cursor.fetchone() is not None
+
+    def get_partition_key(self, table_name: str) -> Optional[str]:
+        """Return the partition key column of an existing partitioned table."""
+        table_name = self.clean_column_name(table_name)
+        self.cursor.execute(
+            """
+            SELECT a.attname
+            FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_attribute a
+                ON a.attrelid = pt.partrelid AND a.attnum = pt.partattrs[0]
+            WHERE n.nspname = %s AND c.relname = %s
+            """,
+            (self.schema, table_name),
+        )
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+    def resolve_partition_column(
+        self, table_name: str, df: pd.DataFrame
+    ) -> Optional[str]:
+        """Resolve the partition column of a table once and reuse it.
+
+        Existing tables keep the key they were created with (or stay flat),
+        whether or not partitioning is enabled for this run; new tables use
+        the configured or detected column of the first batch, so later
+        batches with all-NULL samples cannot switch the key.
+        """
+        table_name = self.clean_column_name(table_name)
+        if table_name in self._partition_keys:
+            return self._partition_keys[table_name]
+
+        if self.table_exists(table_name):
+            partition_column = self.get_partition_key(table_name)
+            if partition_column is None and self.partition:
+                logger.warning(
+                    f"Table {self.schema}.{table_name} already exists unpartitioned"
+                )
+        elif self.partition:
+            partition_column = self.get_partition_column(df)
+        else:
+            partition_column = None
+
+        self._partition_keys[table_name] = partition_column
+        return partition_column
+
+    def get_partitions(self, table_name: str) -> List[str]:
+        """List the monthly partitions attached to a table."""
+        table_name = self.clean_column_name(table_name)
+        self.cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            JOIN pg_namespace n ON n.oid = parent.relnamespace
+            WHERE n.nspname = %s AND parent.relname = %s
+            """,
+            (self.schema, table_name),
+        )
+        prefix = f"{table_name}_p"
+        return sorted(
+            row[0] for row in self.cursor.fetchall() if row[0].startswith(prefix)
+        )
+
+    def ensure_partitions(
+        self, table_name: str, df: pd.DataFrame, partition_column: str
+    ) -> None:
+        """Create any monthly partitions needed to hold the rows in df."""
+        table_name = self.clean_column_name(table_name)
+        known = self._known_partitions.get(table_name)
+        if known is None:
+            known = set(self.get_partitions(table_name))
+            self._known_partitions[table_name] = known
+
+        months = (
+            pd.to_datetime(df[partition_column], errors="coerce")
+            .dropna()
+            .dt.to_period("M")
+            .unique()
+        )
+
+        for month in sorted(months):
+            partition_name = f"{table_name}_p{month.year:04d}_{month.month:02d}"
+            if partition_name in known:
+                continue
+
+            # Not attached; a table of that name is a previously detached month
+            if self.table_exists(partition_name):
+                raise ValueError(
+                    f"Partition {self.schema}.{partition_name} exists but is "
+                    f"detached from {self.schema}.{table_name}; reattach or drop "
+                    f"it before loading rows for {month}"
+                )
+
+            start = month.start_time.strftime("%Y-%m-%d")
+            end = (month + 1).start_time.strftime("%Y-%m-%d")
+            self.cursor.execute(
+                f"""
+                CREATE TABLE {self.schema}.{partition_name}
+                PARTITION OF {self.schema}.{table_name}
+                FOR VALUES FROM ('{start}') TO ('{end}');
+                """
+            )
+            known.add(partition_name)
+            logger.info(f"Partition {self.schema}.{partition_name} created")
+
+        self._commit()
+
+    def detach_partitions_before(
+        self, table_name: str, cutoff: str, drop: bool = False
+    ) -> List[str]:
+        """Detach (and optionally drop) monthly partitions older than cutoff.
+
+        ``cutoff`` is a ``YYYY-MM`` month; partitions for earlier months are
+        removed from the table without touching any rows of newer ones.
+        """
+        table_name = self.clean_column_name(table_name)
+        prefix = f"{table_name}_p"
+
+        removed = []
+        try:
+            cutoff_suffix = datetime.strptime(cutoff, "%Y-%m").strftime("%Y_%m")
+            for partition_name in self.get_partitions(table_name):
+                if partition_name[len(prefix) :] >= cutoff_suffix:
+                    continue
+
+                self.cursor.execute(
+                    f"ALTER TABLE {self.schema}.{table_name} "
+                    f"DETACH PARTITION {self.schema}.{partition_name};"
+                )
+                if drop:
+                    self.cursor.execute(f"DROP TABLE {self.schema}.{partition_name};")
+                removed.append(partition_name)
+                self._known_partitions.get(table_name, set()).discard(partition_name)
+
+            self.conn.commit()
+            action = "Dropped" if drop else "Detached"
+            logger.info(
+                f"{action} {len(removed)} partitions of {self.schema}.{table_name}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to detach partitions of {table_name}: {e}")
+            self.conn.rollback()
+            return []
+
+        return removed
+
     def load_dataframe(
         self, df: pd.DataFrame, table_name: str, chunk_size: int = 1000
     ) -> bool:
@@ -157,8 +444,11 @@ class BulkCSVLoader:
             # Clean column names
             df.columns = [self.clean_column_name(col) for col in df.columns]
 
+            # An existing flat table keeps being loaded flat
+            partition_column = self.resolve_partition_column(table_name, df)
+
             # Create table if it doesn't exist
-            if not self.create_table(table_name, df):
+            if not self.create_table(table_name, df, partition_column):
                 return False
 
             # Insert data in chunks
@@ -168,8 +458,13 @@ class BulkCSVLoader:
             for i in range(0, total_rows, chunk_size):
                 chunk = df.iloc[i : i + chunk_size]
 
+                if partition_column:
+                    self.ensure_partitions(table_name, chunk, partition_column)
+
                 # Prepare data for insertion
                 columns = [f'"{col}"' for col in chunk.columns]
+                # Send NaN, NA and NaT as NULL
+                chunk = chunk.astype(object).where(chunk.notna(), None)
                 values = [tuple(row) for row in chunk.values]
 
                 # Insert chunk
@@ -179,7 +474,7 @@ class BulkCSVLoader:
                 """
 
                 execute_values(self.cursor, insert_sql, values)
-                self.conn.commit()
+                self._commit()
 
                 logger.info(f"Inserted rows {i+1} to {min(i+chunk_size, total_rows)}")
 
@@ -189,10 +484,232 @@ class BulkCSVLoader:
             return True
 
         except Exception as e:
-            logger.error(f"Failed to load data into {table_name}: {e}")
+            self.last_error = f"Failed to load data into {table_name}: {e}"
+            logger.error(self.last_error)
             self.conn.rollback()
             return False
 
+    def get_table_name(self, file_path: Path) -> str:
+        """Derive the table name from a file name, dropping known extensions."""
+        name = file_path.name
+        for suffix in CSV_SUFFIXES + PARQUET_SUFFIXES + ARROW_SUFFIXES:
+            if name.lower().endswith(suffix):
+                return name[: -len(suffix)]
+        return file_path.stem
+
+    def get_csv_compression(self, file_path: Path) -> Optional[str]:
+        """Return the compression of a CSV input from its suffix."""
+        name = file_path.name.lower()
+        for suffix, compression in CSV_COMPRESSION.items():
+            if name.endswith(suffix):
+                return compression
+        return None
+
+    def infer_csv_types(
+        self, file_path: Path, encoding: str = "utf-8", delimiter: str = ","
+    ) -> Dict[str, str]:
+        """Infer the kind of every CSV column over the whole file.
+
+        Reads the file in ``batch_rows`` chunks and widens each column's kind
+        (int, float, bool, datetime or text) across chunks, so a column that
+        is empty or narrower at the start of the file is not typed from its
+        first chunk alone.
+        """
+        kinds: Dict[str, Optional[str]] = {}
+        with pd.read_csv(
+            file_path,
+            encoding=encoding,
+            delimiter=delimiter,
+            compression=self.get_csv_compression(file_path),
+            chunksize=self.batch_rows,
+        ) as reader:
+            for chunk in reader:
+                for col in chunk.columns:
+                    kinds[col] = self._widen_kind(
+                        kinds.get(col), self._chunk_kind(chunk[col], kinds.get(col))
+                    )
+
+        return {col: kind or "text" for col, kind in kinds.items()}
+
+    def _chunk_kind(self, values: pd.Series, current: Optional[str]) -> Optional[str]:
+        """Return the kind of one chunk of a column, or None if it is all null."""
+        non_null = values.dropna()
+        if non_null.empty:
+            return None
+        if pd.api.types.is_bool_dtype(values):
+            return "bool"
+        if pd.api.types.is_integer_dtype(values):
+            return "int"
+        if pd.api.types.is_float_dtype(values):
+            return "float"
+        # Only columns that could still be dates are worth a full parse
+        if current not in (None, "datetime"):
+            return "text"
+        try:
+            pd.to_datetime(non_null.iloc[:1])
+        except (ValueError, TypeError, OverflowError):
+            return "text"
+        parsed = pd.to_datetime(non_null, errors="coerce")
+        return "datetime" if parsed.notna().all() else "text"
+
+    def _widen_kind(self, current: Optional[str], new: Optional[str]) -> Optional[str]:
+        """Combine the kinds of a column seen in two chunks."""
+        if current is None or current == new:
+            return new or current
+        if new is None:
+            return current
+        if {current, new} == {"int", "float"}:
+            return "float"
+        return "text"
+
+    def iter_csv_batches(
+        self,
+        file_path: Path,
+        encoding: str = "utf-8",
+        delimiter: str = ",",
+        kinds: Optional[Dict[str, str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield CSV chunks typed with kinds inferred over the whole file."""
+        if kinds is None:
+            kinds = self.infer_csv_types(file_path, encoding, delimiter)
+
+        with pd.read_csv(
+            file_path,
+            encoding=encoding,
+            delimiter=delimiter,
+            compression=self.get_csv_compression(file_path),
+            chunksize=self.batch_rows,
+            dtype={col: CSV_KIND_DTYPES[kind] for col, kind in kinds.items()},
+        ) as reader:
+            for chunk in reader:
+                for col, kind in kinds.items():
+                    if kind == "datetime":
+                        chunk[col] = pd.to_datetime(chunk[col], errors="coerce")
+                yield chunk
+
+    def get_cached_parquet(
+        self, file_path: Path, encoding: str = "utf-8", delimiter: str = ","
+    ) -> Path:
+        """Return a typed Parquet copy of a CSV file, converting it if needed.
+
+        Column types are inferred over the whole file first, then the CSV is
+        streamed block by block and each block is appended to the Parquet
+        file, so staging never holds the whole file in memory.
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+
+        # Key on file content plus the options that affect parsing
+        digest = hashlib.sha256(
+            f"{STAGING_CACHE_VERSION}|{encoding}|{delimiter}|".encode()
+        )
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+
+        cache_path = (
+            self.cache_dir
+            / f"{self.get_table_name(file_path)}-{digest.hexdigest()[:16]}.parquet"
+        )
+        if cache_path.exists():
+            logger.info(f"Using staged Parquet cache: {cache_path.name}")
+            return cache_path
+
+        logger.info(f"Staging {file_path.name} as Parquet: {cache_path.name}")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".parquet.tmp")
+
+        arrow_types = {
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "bool": pa.bool_(),
+            "datetime": pa.timestamp("us"),
+            "text": pa.string(),
+        }
+        kinds = self.infer_csv_types(file_path, encoding, delimiter)
+
+        try:
+            source = pa.input_stream(
+                str(file_path), compression=self.get_csv_compression(file_path)
+            )
+            with source:
+                reader = pa_csv.open_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(
+                        encoding=encoding, block_size=STAGING_BLOCK_SIZE
+                    ),
+                    parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={
+                            col: arrow_types[kind] for col, kind in kinds.items()
+                        },
+                        timestamp_parsers=[pa_csv.ISO8601, *STAGING_TIMESTAMP_FORMATS],
+                    ),
+                )
+                with pq.ParquetWriter(tmp_path, reader.schema) as writer:
+                    for batch in reader:
+                        writer.write_table(pa.Table.from_batches([batch]))
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        tmp_path.replace(cache_path)
+        return cache_path
+
+    def iter_file_batches(
+        self, file_path: Path, encoding: str = "utf-8", delimiter: str = ","
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the contents of an input file as DataFrame batches.
+
+        Plain and gzip/zstd-compressed CSV files are read ``batch_rows`` rows
+        at a time with column types inferred over the whole file, or through
+        the staging cache when one is configured. Parquet and Arrow IPC files
+        are memory-mapped and read in record batches of ``batch_rows`` rows.
+        """
+        name = file_path.name.lower()
+
+        if name.endswith(CSV_SUFFIXES):
+            if self.cache_dir is not None:
+                try:
+                    file_path = self.get_cached_parquet(file_path, encoding, delimiter)
+                    name = file_path.name.lower()
+                except Exception as e:
+                    # Values pyarrow cannot convert fall back to pandas parsing
+                    logger.warning(
+                        f"Staging {file_path.name} failed, reading CSV directly: {e}"
+                    )
+
+            if name.endswith(CSV_SUFFIXES):
+                yield from self.iter_csv_batches(file_path, encoding, delimiter)
+                return
+
+        if name.endswith(PARQUET_SUFFIXES):
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(file_path, memory_map=True)
+            for batch in parquet_file.iter_batches(batch_size=self.batch_rows):
+                yield batch.to_pandas()
+
+        elif name.endswith(ARROW_SUFFIXES):
+            import pyarrow as pa
+
+            with pa.memory_map(str(file_path), "r") as source:
+                try:
+                    reader = pa.ipc.open_file(source)
+                    batches = (
+                        reader.get_batch(i) for i in range(reader.num_record_batches)
+                    )
+                except pa.ArrowInvalid:
+                    # Not the IPC file format, fall back to the streaming format
+                    source.seek(0)
+                    batches = pa.ipc.open_stream(source)
+                for batch in batches:
+                    yield batch.to_pandas()
+
+        else:
+            raise ValueError(f"Unsupported input file type: {file_path.name}")
+
     def process_csv_file(
         self,
         file_path: Path,
@@ -200,7 +717,11 @@ class BulkCSVLoader:
         encoding: str = "utf-8",
         delimiter: str = ",",
     ) -> Dict[str, Any]:
-        """Process a single CSV file and return results."""
+        """Process a single CSV, Parquet or Arrow file and return results.
+
+        All batches of a file are loaded in one transaction, so a failure
+        part-way through leaves no rows behind and the file can be reloaded.
+        """
         result = {
             "file_name": file_path.name,
             "file_path": str(file_path),
@@ -212,28 +733,39 @@ class BulkCSVLoader:
 
         start_time = time.time()
 
+        # Generate table name from file name
+        table_name = self.get_table_name(file_path)
+
+        self._file_transaction = True
         try:
             logger.info(f"Processing file: {file_path.name}")
 
-            # Read CSV file
-            df = pd.read_csv(file_path, encoding=encoding, delimiter=delimiter)
-            df = df.replace({pd.NA: None, pd.NaT: None})
+            # Load data batch by batch
+            rows_loaded = 0
+            for df in self.iter_file_batches(file_path, encoding, delimiter):
+                if not self.load_dataframe(df, table_name, chunk_size):
+                    raise RuntimeError(
+                        f"{self.last_error} (after {rows_loaded} rows, "
+                        f"none committed)"
+                    )
+                rows_loaded += len(df)
 
-            # Generate table name from file name
-            table_name = file_path.stem  # Remove extension
-
-            # Load data
-            if self.load_dataframe(df, table_name, chunk_size):
-                result["success"] = True
-                result["rows_loaded"] = len(df)
-                result["table_name"] = (
-                    f"{self.schema}.{self.clean_column_name(table_name)}"
-                )
+            self.conn.commit()
+            result["success"] = True
+            result["rows_loaded"] = rows_loaded
+            result["table_name"] = f"{self.schema}.{self.clean_column_name(table_name)}"
 
         except Exception as e:
+            self.conn.rollback()
+            # Partitions and tables created in the transaction are gone too
+            self._known_partitions.pop(self.clean_column_name(table_name), None)
+            self._partition_keys.pop(self.clean_column_name(table_name), None)
             result["error"] = str(e)
             logger.error(f"Error processing {file_path.name}: {e}")
 
+        finally:
+            self._file_transaction = False
+
         result["processing_time"] = time.time() - start_time
         return result
 
@@ -334,6 +866,15 @@ Detailed Results:
         return report
 
 
+def month_arg(value: str) -> str:
+    """Validate a YYYY-MM command line argument."""
+    try:
+        datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}")
+    return value
+
+
 def main():
     parser = argparse.ArgumentParser(description="Bulk CSV to PostgreSQL Loader")
     parser.add_argument("folder_path", help="Path to folder containing CSV files")
@@ -350,8 +891,47 @@ def main():
     )
     parser.add_argument("--encoding", default="utf-8", help="CSV file encoding")
     parser.add_argument("--delimiter", default=",", help="CSV delimiter")
-    parser.add_argument("--pattern", default="*.csv", help="File pattern to match")
+    parser.add_argument(
+        "--pattern",
+        default="*.csv",
+        help="File pattern to match (csv, csv.gz, csv.zst, parquet or arrow)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for the Parquet staging cache of converted CSV files",
+    )
+    parser.add_argument(
+        "--batch-rows",
+        type=int,
+        default=100000,
+        help="Rows per batch when reading CSV, Parquet or Arrow files",
+    )
     parser.add_argument("--report", help="Output file for detailed report")
+    parser.add_argument(
+        "--partition",
+        action="store_true",
+        help="Create tables range-partitioned by month on a timestamp column",
+    )
+    parser.add_argument(
+        "--partition-column",
+        help="Column to partition on (default: first detected timestamp column)",
+    )
+    parser.add_argument(
+        "--detach-before",
+        metavar="YYYY-MM",
+        type=month_arg,
+        help="Detach partitions for months before this one after loading",
+    )
+    parser.add_argument(
+        "--detach-only",
+        action="store_true",
+        help="Only apply --detach-before to the folder's tables, without loading",
+    )
+    parser.add_argument(
+        "--drop-detached",
+        action="store_true",
+        help="Drop partitions removed by --detach-before instead of keeping them",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -360,6 +940,9 @@ def main():
 
     args = parser.parse_args()
 
+    if args.detach_only and not args.detach_before:
+        parser.error("--detach-only requires --detach-before")
+
     # Validate folder path
     if not os.path.exists(args.folder_path):
         logger.error(f"Folder not found: {args.folder_path}")
@@ -377,6 +960,10 @@ def main():
         user=args.user,
         password=args.password,
         schema=args.schema,
+        partition=args.partition or bool(args.partition_column),
+        partition_column=args.partition_column,
+        cache_dir=args.cache_dir,
+        batch_rows=args.batch_rows,
     )
 
     try:
@@ -392,6 +979,21 @@ def main():
                 logger.info(f"  - {file_path.name}")
             return
 
+        if args.detach_only:
+            # Retire old partitions without reloading (and duplicating) any rows
+            table_names = {
+                loader.get_table_name(file_path)
+                for file_path in Path(args.folder_path).glob(args.pattern)
+            }
+            for table_name in sorted(table_names):
+                if loader.is_partitioned(table_name):
+                    loader.detach_partitions_before(
+                        table_name, args.detach_before, drop=args.drop_detached
+                    )
+                else:
+                    logger.warning(f"Table {table_name} is not partitioned, skipping")
+            return
+
         # Process all CSV files
         results = loader.process_folder(
             args.folder_path,
@@ -401,6 +1003,17 @@ def main():
             file_pattern=args.pattern,
         )
 
+        # Retire old partitions of the loaded tables
+        if args.detach_before:
+            for result in results:
+                table_name = loader.get_table_name(Path(result["file_name"]))
+                if result["success"] and loader.is_partitioned(table_name):
+                    loader.detach_partitions_before(
+                        table_name,
+                        args.detach_before,
+                        drop=args.drop_detached,
+                    )
+
         # Generate and display report
         report = loader.generate_report(results, args.report)
         print(report)
@@ -3,9 +3,12 @@
 MCP Server for PostgreSQL
 """
 
+import math
+from statistics import NormalDist
+
 from psycopg2.extras import RealDictCursor
 from mcp.server.fastmcp import FastMCP
-from psycopg2 import pool
+from psycopg2 import pool, sql as pgsql
 
 
 # Database configuration
@@ -80,6 +83,137 @@ def execute_query(sql):
         return {"error": f"Query failed: {str(e)}"}
 
 
+@mcp.tool()
+def execute_approximate_query(
+    table_name,
+    aggregate="count",
+    column=None,
+    where=None,
+    group_by=None,
+    sample_percent=1.0,
+    method="BERNOULLI",
+    confidence=0.95,
+):
+    """Estimate COUNT, SUM or AVG over a random sample of a table.
+
+    Runs the aggregate over TABLESAMPLE BERNOULLI/SYSTEM(sample_percent),
+    scales the result back to the full table and returns an estimate with a
+    confidence interval. Use it for quick first-pass exploration of large
+    tables; use execute_query when an exact answer is needed.
+
+    `column` may be a column name or SQL expression (e.g. a CASE WHEN
+    returning 1/0 to estimate a share with AVG). `where` is an optional SQL
+    filter and `group_by` an optional column name. Bounds are null when
+    fewer than two rows were sampled. SYSTEM samples whole pages, so it is
+    cheaper, but its bounds assume row-level sampling and are flagged with
+    `bounds_approximate`; they can badly understate the error when rows are
+    clustered on disk.
+    """
+    aggregate = str(aggregate).lower()
+    method = str(method).upper()
+    if aggregate not in ("count", "sum", "avg"):
+        return {"error": "aggregate must be one of count, sum, avg"}
+    if aggregate != "count" and not column:
+        return {"error": f"column is required for {aggregate}"}
+    if method not in ("BERNOULLI", "SYSTEM"):
+        return {"error": "method must be BERNOULLI or SYSTEM"}
+    try:
+        sample_percent = float(sample_percent)
+        z = NormalDist().inv_cdf(0.5 + float(confidence) / 2)
+    except Exception:
+        return {"error": "sample_percent and confidence must be numbers"}
+    if not 0 < sample_percent <= 100:
+        return {"error": "sample_percent must be in (0, 100]"}
+    if any(";" in (fragment or "") for fragment in (column, where)):
+        return {"error": "column and where must be single SQL expressions"}
+
+    if aggregate == "count":
+        # COUNT works on any column type, so only sum/avg cast to a number
+        aggregates = pgsql.SQL(
+            f"COUNT({column}) AS n, NULL AS s, NULL AS ss"
+            if column
+            else "COUNT(*) AS n, NULL AS s, NULL AS ss"
+        )
+    else:
+        value = f"({column})::double precision"
+        aggregates = pgsql.SQL(
+            f"COUNT({value}) AS n, SUM({value}) AS s, SUM({value} * {value}) AS ss"
+        )
+    query = pgsql.SQL(
+        "SELECT {group_select}{aggregates} "
+        "FROM {table} TABLESAMPLE {method} ({percent}){where}{group_by}"
+    ).format(
+        group_select=(
+            pgsql.SQL("{} AS grp, ").format(pgsql.Identifier(group_by))
+            if group_by
+            else pgsql.SQL("")
+        ),
+        aggregates=aggregates,
+        table=pgsql.Identifier(table_name),
+        method=pgsql.SQL(method),
+        percent=pgsql.Literal(sample_percent),
+        where=pgsql.SQL(f" WHERE {where}") if where else pgsql.SQL(""),
+        group_by=(
+            pgsql.SQL(" GROUP BY {}").format(pgsql.Identifier(group_by))
+            if group_by
+            else pgsql.SQL("")
+        ),
+    )
+
+    try:
+        with get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(query)
+                rows = cursor.fetchall()
+    except Exception as e:
+        return {"error": f"Query failed: {str(e)}"}
+
+    p = sample_percent / 100
+    results = []
+    for row in rows:
+        n = row["n"] or 0
+        s = row["s"] or 0.0
+        ss = row["ss"] or 0.0
+
+        # Horvitz-Thompson estimates under Bernoulli sampling with rate p
+        if aggregate == "count":
+            estimate = n / p
+            stderr = math.sqrt(n * (1 - p)) / p
+        elif aggregate == "sum":
+            estimate = s / p
+            stderr = math.sqrt(ss * (1 - p)) / p
+        else:
+            estimate = s / n if n else None
+            stderr = (
+                math.sqrt(max((ss - s * s / n) / (n - 1), 0.0) / n) if n > 1 else None
+            )
+
+        # Fewer than two sampled rows give no usable variance estimate
+        if n < 2:
+            stderr = None
+
+        result = {
+            "estimate": estimate,
+            "lower_bound": estimate - z * stderr if stderr is not None else None,
+            "upper_bound": estimate + z * stderr if stderr is not None else None,
+            "standard_error": stderr,
+            "sample_rows": n,
+        }
+        if group_by:
+            result = {group_by: row["grp"], **result}
+        results.append(result)
+
+    return {
+        "data": results,
+        "aggregate": aggregate,
+        "sample_percent": sample_percent,
+        "method": method,
+        "confidence": confidence,
+        # SYSTEM samples whole pages, so the row-level bounds understate error
+        "bounds_approximate": method == "SYSTEM",
+    }
+
+
 @mcp.prompt()
 def data_insight_prompt():
     """Generic prompt for the Data Insight Assistant."""
@@ -90,7 +224,8 @@ def data_insight_prompt():
 1. Start by exploring available tables by using the available tools.
 2. Understand data structure with schema.
 3. Generate only SELECT SQL queries for analysis.
-4. Provide insights and recommendations in concise and crisp manner.
+4. For rough, exploratory questions on large tables, use the approximate query tool first and report its error bounds.
+5. Provide insights and recommendations in concise and crisp manner.
 
 **Example Questions:**
 - "What data do we have?"